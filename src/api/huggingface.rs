@@ -1,11 +1,15 @@
 use anyhow::{anyhow, Context, Result};
 use hf_hub::api::sync::ApiBuilder;
+use once_cell::sync::OnceCell;
 use reqwest::blocking::Client;
 use serde::Deserialize;
 use serde_json::Value;
 use std::collections::HashSet;
 use std::fs;
+use std::io::{self, ErrorKind};
 use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+use std::sync::{Condvar, Mutex, PoisonError};
 use std::thread;
 use std::time::Duration;
 
@@ -30,6 +34,85 @@ struct RawModelSummary {
     tags: Vec<String>,
 }
 
+/// Número máximo de transferencias simultáneas con Hugging Face en todo el proceso, sumando las
+/// instalaciones en curso y los fragmentos `.safetensors` que cada una descarga en paralelo.
+const MAX_PARALLEL_DOWNLOADS: usize = 3;
+
+static DOWNLOAD_SLOTS: DownloadSlots = DownloadSlots::new(MAX_PARALLEL_DOWNLOADS);
+
+/// Semáforo contador que reparte los huecos de descarga entre todos los hilos del proceso.
+struct DownloadSlots {
+    available: Mutex<usize>,
+    released: Condvar,
+}
+
+impl DownloadSlots {
+    const fn new(capacity: usize) -> Self {
+        Self {
+            available: Mutex::new(capacity),
+            released: Condvar::new(),
+        }
+    }
+
+    /// Bloquea el hilo actual hasta que quede un hueco libre.
+    fn acquire(&self) -> DownloadSlot<'_> {
+        let mut available = self
+            .available
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        while *available == 0 {
+            available = self
+                .released
+                .wait(available)
+                .unwrap_or_else(PoisonError::into_inner);
+        }
+        *available -= 1;
+        DownloadSlot { slots: self }
+    }
+
+    /// Reserva un hueco solo si hay alguno libre en este momento.
+    fn try_acquire(&self) -> Option<DownloadSlot<'_>> {
+        let mut available = self
+            .available
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        if *available == 0 {
+            return None;
+        }
+        *available -= 1;
+        Some(DownloadSlot { slots: self })
+    }
+}
+
+/// Hueco de descarga reservado; se devuelve al semáforo al soltarse.
+struct DownloadSlot<'a> {
+    slots: &'a DownloadSlots,
+}
+
+impl Drop for DownloadSlot<'_> {
+    fn drop(&mut self) {
+        *self
+            .slots
+            .available
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner) += 1;
+        self.slots.released.notify_one();
+    }
+}
+
+static HTTP_CLIENT: OnceCell<Client> = OnceCell::new();
+
+/// Cliente HTTP compartido por todas las llamadas a la API de Hugging Face, de modo que las
+/// búsquedas y descargas reutilizan su pool de conexiones en lugar de repetir el handshake TLS.
+fn http_client() -> Result<&'static Client> {
+    HTTP_CLIENT.get_or_try_init(|| {
+        Client::builder()
+            .user_agent("JungleMonkAI/0.1")
+            .build()
+            .context("No se pudo crear el cliente HTTP para Hugging Face")
+    })
+}
+
 fn huggingface_incompatibility(raw: &RawModelSummary) -> Option<String> {
     let tags_lower: Vec<String> = raw.tags.iter().map(|tag| tag.to_lowercase()).collect();
     let model_id_lower = raw.model_id.to_lowercase();
@@ -90,14 +173,9 @@ fn huggingface_incompatibility(raw: &RawModelSummary) -> Option<String> {
 
 /// Busca modelos en Hugging Face y devuelve una lista de metadatos resumidos.
 pub fn search_models(query: &str, token: Option<&str>) -> Result<Vec<LocalModelCard>> {
-    let client = Client::builder()
-        .timeout(Duration::from_secs(30))
-        .user_agent("JungleMonkAI/0.1")
-        .build()
-        .context("No se pudo crear el cliente HTTP para Hugging Face")?;
-
-    let mut request = client
+    let mut request = http_client()?
         .get("https://huggingface.co/api/models")
+        .timeout(Duration::from_secs(30))
         .query(&[("search", query), ("limit", "25")]);
 
     if let Some(token) = token {
@@ -137,18 +215,21 @@ pub fn search_models(query: &str, token: Option<&str>) -> Result<Vec<LocalModelC
 }
 
 /// Descarga metadatos básicos del modelo y los almacena en disco dentro del directorio indicado.
+///
+/// La llamada espera a que haya un hueco libre en el límite global de descargas; `on_started` se
+/// invoca en cuanto se obtiene, antes de iniciar ninguna transferencia.
 pub fn download_model(
     model: &LocalModelCard,
     install_dir: &Path,
     token: Option<&str>,
+    on_started: impl FnOnce(),
 ) -> Result<PathBuf> {
-    let client = Client::builder()
-        .timeout(Duration::from_secs(60))
-        .user_agent("JungleMonkAI/0.1")
-        .build()
-        .context("No se pudo crear el cliente HTTP para Hugging Face")?;
+    let _slot = DOWNLOAD_SLOTS.acquire();
+    on_started();
 
-    let mut request = client.get(format!("https://huggingface.co/api/models/{}", model.id));
+    let mut request = http_client()?
+        .get(format!("https://huggingface.co/api/models/{}", model.id))
+        .timeout(Duration::from_secs(60));
     if let Some(token) = token {
         if !token.trim().is_empty() {
             request = request.bearer_auth(token.trim());
@@ -181,14 +262,12 @@ pub fn download_model(
     let target_dir = install_dir.join(&safe_dir_name);
     let staging_dir = install_dir.join(format!("{}__downloading", safe_dir_name));
 
-    if staging_dir.exists() {
-        fs::remove_dir_all(&staging_dir).with_context(|| {
-            format!(
-                "No se pudo limpiar el directorio temporal de descarga {:?}",
-                staging_dir
-            )
-        })?;
-    }
+    remove_dir_if_present(&staging_dir).with_context(|| {
+        format!(
+            "No se pudo limpiar el directorio temporal de descarga {:?}",
+            staging_dir
+        )
+    })?;
     fs::create_dir_all(&staging_dir)
         .with_context(|| format!("No se pudo crear el directorio {:?}", staging_dir))?;
 
@@ -232,7 +311,7 @@ pub fn download_model(
                         fs::create_dir_all(parent)
                             .with_context(|| format!("No se pudo crear {:?}", parent))?;
                     }
-                    fs::copy(&path, &destination).with_context(|| {
+                    link_or_copy(&path, &destination).with_context(|| {
                         format!(
                             "No se pudo copiar el archivo descargado de Hugging Face {:?} a {:?}",
                             path, destination
@@ -307,14 +386,66 @@ pub fn download_model(
         ));
     }
 
-    for file in safetensor_files {
-        download_file(&file, false)?;
-    }
+    // Los modelos fragmentados publican varios `.safetensors`. El hilo actual ya ocupa un hueco del
+    // límite global; solo se lanzan hilos adicionales por cada hueco que esté libre ahora mismo, y
+    // todos toman el siguiente archivo pendiente hasta agotar la lista o encontrar un error.
+    let next_file = AtomicUsize::new(0);
+    let failed = AtomicBool::new(false);
+    let download_pending = || -> Result<()> {
+        while !failed.load(Ordering::Relaxed) {
+            let index = next_file.fetch_add(1, Ordering::Relaxed);
+            let Some(file) = safetensor_files.get(index) else {
+                break;
+            };
+            if let Err(err) = download_file(file, false) {
+                failed.store(true, Ordering::Relaxed);
+                return Err(err);
+            }
+        }
+        Ok(())
+    };
+    let extra_slots: Vec<_> = (1..safetensor_files.len())
+        .map_while(|_| DOWNLOAD_SLOTS.try_acquire())
+        .collect();
+    thread::scope(|scope| -> Result<()> {
+        let download_pending = &download_pending;
+        let handles: Vec<_> = extra_slots
+            .into_iter()
+            .map(|slot| {
+                scope.spawn(move || {
+                    let _slot = slot;
+                    download_pending()
+                })
+            })
+            .collect();
+
+        let mut first_error = download_pending().err();
+        for handle in handles {
+            let outcome = handle
+                .join()
+                .unwrap_or_else(|_| Err(anyhow!("Un hilo de descarga de Hugging Face falló")));
+            if let Err(err) = outcome {
+                if first_error.is_none() {
+                    first_error = Some(err);
+                }
+            }
+        }
+
+        match first_error {
+            Some(err) => Err(err),
+            None => Ok(()),
+        }
+    })?;
 
     let modules_path = staging_dir.join("modules.json");
-    if modules_path.exists() {
-        let module_data = fs::read_to_string(&modules_path)
-            .with_context(|| format!("No se pudo leer {:?}", modules_path))?;
+    let module_data = match fs::read_to_string(&modules_path) {
+        Ok(data) => Some(data),
+        Err(err) if err.kind() == ErrorKind::NotFound => None,
+        Err(err) => {
+            return Err(err).with_context(|| format!("No se pudo leer {:?}", modules_path));
+        }
+    };
+    if let Some(module_data) = module_data {
         let modules: Vec<Value> = match serde_json::from_str(&module_data) {
             Ok(parsed) => parsed,
             Err(err) => {
@@ -341,14 +472,12 @@ pub fn download_model(
 
     ensure_required_assets(&staging_dir)?;
 
-    if target_dir.exists() {
-        fs::remove_dir_all(&target_dir).with_context(|| {
-            format!(
-                "No se pudo reemplazar el directorio de instalación anterior {:?}",
-                target_dir
-            )
-        })?;
-    }
+    remove_dir_if_present(&target_dir).with_context(|| {
+        format!(
+            "No se pudo reemplazar el directorio de instalación anterior {:?}",
+            target_dir
+        )
+    })?;
 
     fs::rename(&staging_dir, &target_dir).with_context(|| {
         format!(
@@ -360,6 +489,29 @@ pub fn download_model(
     Ok(target_dir)
 }
 
+/// Coloca en `destination` un archivo descargado en la caché de hf-hub.
+///
+/// Se intenta primero un enlace duro al blob de la caché, que no copia datos y evita duplicar en
+/// disco los pesos del modelo; si el sistema de archivos no lo admite (por ejemplo, al cruzar
+/// dispositivos) se recurre a `fs::copy`.
+fn link_or_copy(source: &Path, destination: &Path) -> io::Result<()> {
+    // hf-hub expone los archivos del snapshot como enlaces simbólicos hacia `blobs/`; se enlaza el
+    // blob real para que la instalación no dependa de la ruta relativa del snapshot.
+    let blob = fs::canonicalize(source)?;
+    if fs::hard_link(&blob, destination).is_ok() {
+        return Ok(());
+    }
+    fs::copy(&blob, destination).map(|_| ())
+}
+
+/// Elimina `dir` de forma recursiva; que no exista no se considera un error.
+fn remove_dir_if_present(dir: &Path) -> io::Result<()> {
+    match fs::remove_dir_all(dir) {
+        Err(err) if err.kind() == ErrorKind::NotFound => Ok(()),
+        result => result,
+    }
+}
+
 fn sanitize_id(id: &str) -> String {
     id.chars()
         .map(|ch| match ch {
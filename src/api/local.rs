@@ -7,6 +7,7 @@ use candle_transformers::models::bert::{
 use log::warn;
 use serde_json::Value;
 use std::fs;
+use std::io::ErrorKind;
 use std::path::{Path, PathBuf};
 use tokenizers::Tokenizer;
 use tokenizers::{
@@ -70,10 +71,6 @@ fn normalized_keywords(text: &str) -> Vec<String> {
 
 fn read_metadata(model_dir: &Path) -> Option<Value> {
     let metadata_path = model_dir.join("metadata.json");
-    if !metadata_path.exists() {
-        return None;
-    }
-
     match fs::read_to_string(&metadata_path) {
         Ok(raw) => match serde_json::from_str(&raw) {
             Ok(value) => Some(value),
@@ -85,6 +82,7 @@ fn read_metadata(model_dir: &Path) -> Option<Value> {
                 None
             }
         },
+        Err(err) if err.kind() == ErrorKind::NotFound => None,
         Err(err) => {
             warn!(
                 "No se pudo leer el archivo de metadatos {:?}: {}",
@@ -418,45 +416,49 @@ impl JarvisEncoder {
         };
 
         let modules_path = model_dir.join("modules.json");
-        let normalize = if modules_path.exists() {
-            let data = fs::read_to_string(&modules_path)
-                .with_context(|| format!("No se pudo leer {:?}", modules_path))?;
-            let modules: Vec<Value> = match serde_json::from_str(&data) {
-                Ok(parsed) => parsed,
-                Err(err) => {
-                    eprintln!(
-                        "modules.json inválido en {:?}: {}. Se omitirá la detección de módulos.",
-                        modules_path, err
-                    );
-                    Vec::new()
-                }
-            };
-            modules.iter().any(|module| {
-                module
-                    .get("type")
-                    .and_then(|value| value.as_str())
-                    .map(|ty| ty.to_lowercase().contains("normalize"))
-                    .unwrap_or(false)
-            })
-        } else {
-            true
+        let normalize = match fs::read_to_string(&modules_path) {
+            Ok(data) => {
+                let modules: Vec<Value> = match serde_json::from_str(&data) {
+                    Ok(parsed) => parsed,
+                    Err(err) => {
+                        eprintln!(
+                            "modules.json inválido en {:?}: {}. Se omitirá la detección de módulos.",
+                            modules_path, err
+                        );
+                        Vec::new()
+                    }
+                };
+                modules.iter().any(|module| {
+                    module
+                        .get("type")
+                        .and_then(|value| value.as_str())
+                        .map(|ty| ty.to_lowercase().contains("normalize"))
+                        .unwrap_or(false)
+                })
+            }
+            Err(err) if err.kind() == ErrorKind::NotFound => true,
+            Err(err) => {
+                return Err(err).with_context(|| format!("No se pudo leer {:?}", modules_path));
+            }
         };
 
         let pooling_path = model_dir.join("1_Pooling/config.json");
-        let mean_pooling = if pooling_path.exists() {
-            #[derive(serde::Deserialize)]
-            struct PoolingConfig {
-                #[serde(default)]
-                pooling_mode_mean_tokens: bool,
-            }
+        #[derive(serde::Deserialize)]
+        struct PoolingConfig {
+            #[serde(default)]
+            pooling_mode_mean_tokens: bool,
+        }
 
-            let config = fs::read_to_string(&pooling_path)
-                .with_context(|| format!("No se pudo leer {:?}", pooling_path))?;
-            let pooling: PoolingConfig = serde_json::from_str(&config)
-                .with_context(|| format!("No se pudo parsear {:?}", pooling_path))?;
-            pooling.pooling_mode_mean_tokens
-        } else {
-            true
+        let mean_pooling = match fs::read_to_string(&pooling_path) {
+            Ok(config) => {
+                let pooling: PoolingConfig = serde_json::from_str(&config)
+                    .with_context(|| format!("No se pudo parsear {:?}", pooling_path))?;
+                pooling.pooling_mode_mean_tokens
+            }
+            Err(err) if err.kind() == ErrorKind::NotFound => true,
+            Err(err) => {
+                return Err(err).with_context(|| format!("No se pudo leer {:?}", pooling_path));
+            }
         };
 
         Ok(JarvisEncoder::Bert {
@@ -501,6 +503,13 @@ impl JarvisEncoder {
                 if seq_len == 0 {
                     return Ok(Vec::new());
                 }
+                // La máscara se conserva en memoria para el pooling en lugar de leerla de vuelta
+                // desde el tensor tras la inferencia.
+                let mask = if mask.is_empty() {
+                    vec![1f32; seq_len]
+                } else {
+                    mask
+                };
 
                 let input_ids = Tensor::new(ids, device)?.reshape((1, seq_len))?;
                 let token_type_ids = if type_ids.is_empty() {
@@ -508,17 +517,12 @@ impl JarvisEncoder {
                 } else {
                     Tensor::new(type_ids, device)?.reshape((1, seq_len))?
                 };
-                let attention_mask = if mask.is_empty() {
-                    Tensor::ones((1, seq_len), DType::F32, device)?
-                } else {
-                    Tensor::new(mask, device)?.reshape((1, seq_len))?
-                };
+                let attention_mask = Tensor::new(mask.as_slice(), device)?.reshape((1, seq_len))?;
 
                 let hidden_states = model
                     .forward(&input_ids, &token_type_ids, Some(&attention_mask))?
                     .squeeze(0)?
                     .to_vec2::<f32>()?;
-                let attention_mask = attention_mask.squeeze(0)?.to_vec1::<f32>()?;
 
                 let mut embedding = if *mean_pooling {
                     if hidden_states.is_empty() {
@@ -527,8 +531,7 @@ impl JarvisEncoder {
                         let dimension = hidden_states[0].len();
                         let mut accumulator = vec![0f32; dimension];
                         let mut weight = 0f32;
-                        for (token_embedding, &mask_value) in
-                            hidden_states.iter().zip(attention_mask.iter())
+                        for (token_embedding, &mask_value) in hidden_states.iter().zip(mask.iter())
                         {
                             if mask_value > 0.0 {
                                 for (idx, value) in token_embedding.iter().enumerate() {
@@ -2,6 +2,7 @@ use anyhow::Context;
 use chrono::{DateTime, Utc};
 use serde::{de::Error as _, Deserialize, Deserializer, Serialize};
 use std::fs;
+use std::io::Write;
 use std::path::{Path, PathBuf};
 
 /// Datos de configuración específicos de un proveedor de modelos.
@@ -58,21 +59,19 @@ where
         serde_json::Value::Array(entries) => {
             let mut models = Vec::with_capacity(entries.len());
             for entry in entries {
-                match serde_json::from_value::<InstalledModelConfig>(entry.clone()) {
-                    Ok(model) => models.push(model),
-                    Err(_) => {
-                        if let Some(identifier) = entry.as_str() {
-                            models.push(InstalledModelConfig {
-                                identifier: identifier.to_string(),
-                                install_path: String::new(),
-                                size_bytes: 0,
-                                installed_at: Utc::now(),
-                            });
-                        } else {
-                            return Err(D::Error::custom("Formato inválido en installed_models"));
-                        }
-                    }
-                }
+                // Las entradas heredadas son cadenas con el identificador; el resto se decodifica
+                // directamente desde el valor sin clonarlo.
+                let model = match entry {
+                    serde_json::Value::String(identifier) => InstalledModelConfig {
+                        identifier,
+                        install_path: String::new(),
+                        size_bytes: 0,
+                        installed_at: Utc::now(),
+                    },
+                    other => serde_json::from_value::<InstalledModelConfig>(other)
+                        .map_err(|_| D::Error::custom("Formato inválido en installed_models"))?,
+                };
+                models.push(model);
             }
             Ok(models)
         }
@@ -236,7 +235,24 @@ impl AppConfig {
 
     pub fn save(&self) -> anyhow::Result<()> {
         let path = Self::config_path()?;
-        let json = serde_json::to_string_pretty(self)?;
-        fs::write(&path, json).with_context(|| format!("No se pudo guardar {:?}", path))
+        let json = serde_json::to_vec_pretty(self)?;
+        // Se escribe en un archivo temporal, se sincroniza con el disco y solo entonces se renombra,
+        // de modo que una interrupción o un corte de corriente nunca deje un config.json truncado.
+        let temp_path = path.with_extension("json.tmp");
+        let result = fs::File::create(&temp_path)
+            .and_then(|mut file| {
+                file.write_all(&json)?;
+                file.sync_all()
+            })
+            .with_context(|| format!("No se pudo escribir el archivo temporal {:?}", temp_path))
+            .and_then(|()| {
+                fs::rename(&temp_path, &path).with_context(|| {
+                    format!("No se pudo reemplazar {:?} por {:?}", path, temp_path)
+                })
+            });
+        if result.is_err() {
+            let _ = fs::remove_file(&temp_path);
+        }
+        result
     }
 }
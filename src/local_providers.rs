@@ -34,6 +34,19 @@ impl LocalModelProvider {
         }
     }
 
+    /// Resuelve el proveedor a partir de su identificador serializado (ver [`Self::key`]).
+    pub fn from_key(key: &str) -> Option<Self> {
+        match key {
+            "huggingface" => Some(LocalModelProvider::HuggingFace),
+            "github_models" => Some(LocalModelProvider::GithubModels),
+            "replicate" => Some(LocalModelProvider::Replicate),
+            "ollama" => Some(LocalModelProvider::Ollama),
+            "openrouter" => Some(LocalModelProvider::OpenRouter),
+            "modelscope" => Some(LocalModelProvider::Modelscope),
+            _ => None,
+        }
+    }
+
     /// Nombre amigable mostrado en la interfaz.
     pub fn display_name(self) -> &'static str {
         match self {
@@ -148,10 +161,8 @@ impl LocalModelIdentifier {
 
     pub fn parse(value: &str) -> Self {
         if let Some((provider, model)) = value.split_once("::") {
-            let provider = LocalModelProvider::ALL
-                .into_iter()
-                .find(|p| p.key() == provider)
-                .unwrap_or(LocalModelProvider::HuggingFace);
+            let provider =
+                LocalModelProvider::from_key(provider).unwrap_or(LocalModelProvider::HuggingFace);
             Self::new(provider, model.trim())
         } else {
             Self::new(LocalModelProvider::HuggingFace, value.trim())
@@ -171,3 +182,27 @@ impl LocalModelIdentifier {
         format!("{}__{}", self.provider.key(), sanitized)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn provider_keys_round_trip() {
+        for provider in LocalModelProvider::ALL {
+            assert_eq!(LocalModelProvider::from_key(provider.key()), Some(provider));
+        }
+        assert_eq!(LocalModelProvider::from_key("desconocido"), None);
+    }
+
+    #[test]
+    fn identifier_serialization_round_trips_for_every_provider() {
+        for provider in LocalModelProvider::ALL {
+            let identifier = LocalModelIdentifier::new(provider, "org/modelo");
+            assert_eq!(
+                LocalModelIdentifier::parse(&identifier.serialize()),
+                identifier
+            );
+        }
+    }
+}
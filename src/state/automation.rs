@@ -5,6 +5,10 @@ use super::{
 };
 use crate::config::AppConfig;
 use chrono::Local;
+use std::collections::VecDeque;
+
+/// Capacidad del historial de actividad; al llenarse se descarta la entrada más antigua.
+const MAX_ACTIVITY_LOGS: usize = 200;
 
 pub struct AutomationState {
     pub cron_board: CronBoardState,
@@ -12,11 +16,14 @@ pub struct AutomationState {
     pub scheduled_reminders: Vec<ScheduledReminder>,
     pub event_automation: EventAutomationState,
     pub external_integrations: ExternalIntegrationsState,
-    pub activity_logs: Vec<LogEntry>,
+    pub activity_logs: VecDeque<LogEntry>,
 }
 
 impl AutomationState {
     pub fn from_config(_config: &AppConfig) -> Self {
+        let mut activity_logs = VecDeque::with_capacity(MAX_ACTIVITY_LOGS);
+        activity_logs.extend(super::default_logs());
+
         let mut state = Self {
             cron_board: CronBoardState::with_tasks(super::default_scheduled_tasks()),
             workflows: AutomationWorkflowBoard::with_workflows(
@@ -25,7 +32,7 @@ impl AutomationState {
             scheduled_reminders: super::default_scheduled_reminders(),
             event_automation: EventAutomationState::default(),
             external_integrations: ExternalIntegrationsState::default(),
-            activity_logs: super::default_logs(),
+            activity_logs,
         };
 
         let summary = LogEntry {
@@ -44,12 +51,10 @@ impl AutomationState {
     }
 
     pub fn push_activity(&mut self, entry: LogEntry) {
-        self.activity_logs.push(entry);
-        const MAX_ACTIVITY_LOGS: usize = 200;
-        if self.activity_logs.len() > MAX_ACTIVITY_LOGS {
-            let overflow = self.activity_logs.len() - MAX_ACTIVITY_LOGS;
-            self.activity_logs.drain(0..overflow);
+        while self.activity_logs.len() >= MAX_ACTIVITY_LOGS {
+            self.activity_logs.pop_front();
         }
+        self.activity_logs.push_back(entry);
     }
 }
 
@@ -324,10 +324,14 @@ impl<'a> JarvisOrchestrator<'a> {
     }
 
     fn summarize(text: &str) -> String {
-        let mut sanitized = text.replace('\n', " ").trim().to_string();
         const MAX_LEN: usize = 220;
-        if sanitized.chars().count() > MAX_LEN {
-            sanitized = sanitized.chars().take(MAX_LEN).collect::<String>();
+        // Recorte, sustitución de saltos de línea y truncado en una sola pasada sobre la respuesta.
+        let mut chars = text
+            .trim()
+            .chars()
+            .map(|ch| if ch == '\n' { ' ' } else { ch });
+        let mut sanitized: String = chars.by_ref().take(MAX_LEN).collect();
+        if chars.next().is_some() {
             sanitized.push('…');
         }
         sanitized
@@ -24,7 +24,7 @@ use chrono::{DateTime, Local, Utc};
 use resources::ProviderQuotaExceeded;
 use serde::{Deserialize, Serialize};
 use std::borrow::Cow;
-use std::collections::{BTreeMap, BTreeSet, HashMap, HashSet};
+use std::collections::{BTreeMap, BTreeSet, HashMap, HashSet, VecDeque};
 use std::fs;
 use std::path::{Path, PathBuf};
 use std::sync::mpsc::RecvTimeoutError;
@@ -1738,9 +1738,12 @@ pub struct DebugLogEntry {
     pub timestamp: String,
 }
 
+/// Capacidad de la consola de depuración; al llenarse se descarta la entrada más antigua.
+const MAX_DEBUG_CONSOLE_ENTRIES: usize = 400;
+
 #[derive(Clone, Debug)]
 pub struct DebugConsoleState {
-    pub entries: Vec<DebugLogEntry>,
+    pub entries: VecDeque<DebugLogEntry>,
     pub search: String,
     pub level_filter: Option<DebugLogLevel>,
     pub auto_scroll: bool,
@@ -1749,7 +1752,7 @@ pub struct DebugConsoleState {
 impl Default for DebugConsoleState {
     fn default() -> Self {
         Self {
-            entries: Vec::new(),
+            entries: VecDeque::with_capacity(MAX_DEBUG_CONSOLE_ENTRIES),
             search: String::new(),
             level_filter: None,
             auto_scroll: true,
@@ -1760,11 +1763,26 @@ impl Default for DebugConsoleState {
 impl DebugConsoleState {
     pub fn with_entries(entries: Vec<DebugLogEntry>) -> Self {
         let mut state = Self::default();
-        state.entries = entries;
+        state.entries.extend(entries);
         state
     }
 
     pub fn filtered_entries(&self) -> Vec<&DebugLogEntry> {
+        // La consulta se normaliza una sola vez y el texto de búsqueda de cada entrada se construye
+        // sobre un único búfer reutilizado en lugar de asignar dos `String` por entrada. Ambos lados
+        // se pasan a minúsculas carácter a carácter para que la comparación sea coherente.
+        let query = if self.search.trim().is_empty() {
+            None
+        } else {
+            Some(
+                self.search
+                    .chars()
+                    .flat_map(char::to_lowercase)
+                    .collect::<String>(),
+            )
+        };
+        let mut haystack = String::new();
+
         self.entries
             .iter()
             .filter(|entry| {
@@ -1774,39 +1792,39 @@ impl DebugConsoleState {
                     }
                 }
 
-                if self.search.trim().is_empty() {
+                let Some(query) = query.as_deref() else {
                     return true;
-                }
+                };
 
-                let haystack = format!(
-                    "{} {} {}",
+                haystack.clear();
+                for (index, part) in [
                     entry.level.label(),
-                    entry.component,
-                    entry.message
-                )
-                .to_lowercase();
+                    entry.component.as_str(),
+                    entry.message.as_str(),
+                ]
+                .into_iter()
+                .enumerate()
+                {
+                    if index > 0 {
+                        haystack.push(' ');
+                    }
+                    haystack.extend(part.chars().flat_map(char::to_lowercase));
+                }
 
-                haystack.contains(&self.search.to_lowercase())
+                haystack.contains(query)
             })
             .collect()
     }
 
     pub fn level_totals(&self) -> (usize, usize, usize) {
-        let info = self
-            .entries
-            .iter()
-            .filter(|entry| entry.level == DebugLogLevel::Info)
-            .count();
-        let warning = self
-            .entries
-            .iter()
-            .filter(|entry| entry.level == DebugLogLevel::Warning)
-            .count();
-        let error = self
-            .entries
-            .iter()
-            .filter(|entry| entry.level == DebugLogLevel::Error)
-            .count();
+        let (mut info, mut warning, mut error) = (0, 0, 0);
+        for entry in &self.entries {
+            match entry.level {
+                DebugLogLevel::Info => info += 1,
+                DebugLogLevel::Warning => warning += 1,
+                DebugLogLevel::Error => error += 1,
+            }
+        }
         (info, warning, error)
     }
 
@@ -1822,17 +1840,19 @@ impl DebugConsoleState {
             message: message.into(),
             timestamp: Local::now().format("%Y-%m-%d %H:%M:%S").to_string(),
         };
-        self.entries.push(entry);
-        const MAX_ENTRIES: usize = 400;
-        if self.entries.len() > MAX_ENTRIES {
-            let overflow = self.entries.len() - MAX_ENTRIES;
-            self.entries.drain(0..overflow);
+        while self.entries.len() >= MAX_DEBUG_CONSOLE_ENTRIES {
+            self.entries.pop_front();
         }
+        self.entries.push_back(entry);
     }
 }
 
 #[derive(Debug)]
 pub(crate) enum LocalInstallMessage {
+    Started {
+        provider: LocalModelProvider,
+        model_id: String,
+    },
     Success {
         provider: LocalModelProvider,
         model: LocalModelCard,
@@ -2527,6 +2547,9 @@ fn default_debug_console_entries() -> Vec<DebugLogEntry> {
     ]
 }
 
+/// Tiempo sin cambios tras el cual se escribe en disco la configuración pendiente.
+const CONFIG_SAVE_DEBOUNCE: Duration = Duration::from_millis(500);
+
 /// Contiene el estado global de la aplicación.
 pub struct AppState {
     /// Controla la visibilidad de la ventana modal de configuración.
@@ -2605,6 +2628,10 @@ pub struct AppState {
     pub debug_console: DebugConsoleState,
     /// Consultas recientes en el buscador global.
     pub global_search_recent: Vec<String>,
+    /// Indica que hay cambios de configuración pendientes de escribir en disco.
+    config_dirty: bool,
+    /// Momento del último cambio de configuración, usado para agrupar las escrituras.
+    config_changed_at: Instant,
 }
 
 impl Default for AppState {
@@ -2692,6 +2719,8 @@ impl Default for AppState {
             automation,
             debug_console: DebugConsoleState::with_entries(default_debug_console_entries()),
             global_search_recent,
+            config_dirty: false,
+            config_changed_at: Instant::now(),
         };
 
         state.register_workbench_initializer(|registry| {
@@ -3387,12 +3416,7 @@ impl AppState {
             timestamp: Local::now().format("%Y-%m-%d %H:%M:%S").to_string(),
         };
 
-        self.automation.activity_logs.push(entry);
-        const MAX_ACTIVITY_LOGS: usize = 200;
-        if self.automation.activity_logs.len() > MAX_ACTIVITY_LOGS {
-            let overflow = self.automation.activity_logs.len() - MAX_ACTIVITY_LOGS;
-            self.automation.activity_logs.drain(0..overflow);
-        }
+        self.automation.push_activity(entry);
     }
 
     pub fn push_debug_event(
@@ -3560,9 +3584,12 @@ impl AppState {
             return false;
         }
 
-        let sanitized_status = format!("Descargando '{}' desde Hugging Face…", model.id);
-        self.provider_state_mut(provider).install_status = Some(sanitized_status.clone());
-        self.push_activity_log(LogStatus::Running, "Jarvis", sanitized_status);
+        // Las descargas comparten un límite global de transferencias simultáneas; hasta que el hilo
+        // obtiene un hueco la instalación se muestra como en cola.
+        self.provider_state_mut(provider).install_status = Some(format!(
+            "'{}' en cola; se descargará en cuanto haya un hueco libre.",
+            model.id
+        ));
 
         let trimmed_token = token.and_then(|value| {
             let trimmed = value.trim();
@@ -3584,8 +3611,17 @@ impl AppState {
 
         std::thread::spawn(move || {
             let token_ref = trimmed_token.as_deref();
-            let outcome =
-                crate::api::huggingface::download_model(&thread_model, &install_dir, token_ref);
+            let outcome = crate::api::huggingface::download_model(
+                &thread_model,
+                &install_dir,
+                token_ref,
+                || {
+                    let _ = tx.send(LocalInstallMessage::Started {
+                        provider,
+                        model_id: thread_model.id.clone(),
+                    });
+                },
+            );
 
             let message = match outcome {
                 Ok(path) => LocalInstallMessage::Success {
@@ -3724,6 +3760,11 @@ impl AppState {
 
         while let Ok(message) = self.chat.local_install_rx.try_recv() {
             match message {
+                LocalInstallMessage::Started { provider, model_id } => {
+                    let status = format!("Descargando '{}' desde Hugging Face…", model_id);
+                    self.provider_state_mut(provider).install_status = Some(status.clone());
+                    self.push_activity_log(LogStatus::Running, "Jarvis", status);
+                }
                 LocalInstallMessage::Success {
                     provider,
                     model,
@@ -3802,6 +3843,11 @@ impl AppState {
             updated = true;
         }
 
+        if self.pending_config_save_delay() == Some(Duration::ZERO) {
+            self.flush_config();
+            updated = true;
+        }
+
         updated
     }
 
@@ -3940,6 +3986,25 @@ impl AppState {
     pub fn persist_config(&mut self) {
         self.sync_config_from_state();
         self.rebuild_navigation();
+        // Los campos de texto y los sliders llaman aquí en cada pulsación o frame de arrastre, así
+        // que solo se marca el cambio; `update_async_tasks` escribe el archivo cuando la
+        // configuración lleva `CONFIG_SAVE_DEBOUNCE` sin modificarse.
+        self.config_dirty = true;
+        self.config_changed_at = Instant::now();
+    }
+
+    /// Tiempo que falta para escribir la configuración pendiente, si la hay.
+    pub fn pending_config_save_delay(&self) -> Option<Duration> {
+        self.config_dirty
+            .then(|| CONFIG_SAVE_DEBOUNCE.saturating_sub(self.config_changed_at.elapsed()))
+    }
+
+    /// Escribe en disco la configuración pendiente, si la hay.
+    pub fn flush_config(&mut self) {
+        if !self.config_dirty {
+            return;
+        }
+        self.config_dirty = false;
         if let Err(err) = self.config.save() {
             self.chat.messages.push(ChatMessage::system(format!(
                 "No se pudo guardar la configuración: {}",
@@ -5262,30 +5327,16 @@ impl AppState {
 
                 if wants_logs {
                     lines.push("--- Registros y alertas ---".to_string());
-                    let ok_count = self
-                        .automation
-                        .activity_logs
-                        .iter()
-                        .filter(|entry| entry.status == LogStatus::Ok)
-                        .count();
-                    let warn_count = self
-                        .automation
-                        .activity_logs
-                        .iter()
-                        .filter(|entry| entry.status == LogStatus::Warning)
-                        .count();
-                    let err_count = self
-                        .automation
-                        .activity_logs
-                        .iter()
-                        .filter(|entry| entry.status == LogStatus::Error)
-                        .count();
-                    let running_count = self
-                        .automation
-                        .activity_logs
-                        .iter()
-                        .filter(|entry| entry.status == LogStatus::Running)
-                        .count();
+                    let (mut ok_count, mut warn_count, mut err_count, mut running_count) =
+                        (0, 0, 0, 0);
+                    for entry in &self.automation.activity_logs {
+                        match entry.status {
+                            LogStatus::Ok => ok_count += 1,
+                            LogStatus::Warning => warn_count += 1,
+                            LogStatus::Error => err_count += 1,
+                            LogStatus::Running => running_count += 1,
+                        }
+                    }
 
                     if let Some(last_error) = self
                         .automation
@@ -5679,14 +5730,29 @@ pub fn compute_directory_size(path: &Path) -> u64 {
             Ok(metadata) if metadata.is_file() => {
                 *total += metadata.len();
             }
-            Ok(metadata) if metadata.is_dir() => {
-                if let Ok(entries) = fs::read_dir(path) {
-                    for entry in entries.flatten() {
-                        visit(&entry.path(), total);
+            Ok(metadata) if metadata.is_dir() => visit_entries(path, total),
+            _ => {}
+        }
+    }
+
+    // `DirEntry::file_type` reutiliza el tipo que devuelve `readdir`, así que los subdirectorios
+    // se recorren sin un `stat` adicional. Solo los enlaces simbólicos resuelven su destino.
+    fn visit_entries(dir: &Path, total: &mut u64) {
+        let Ok(entries) = fs::read_dir(dir) else {
+            return;
+        };
+
+        for entry in entries.flatten() {
+            match entry.file_type() {
+                Ok(file_type) if file_type.is_dir() => visit_entries(&entry.path(), total),
+                Ok(file_type) if file_type.is_file() => {
+                    if let Ok(metadata) = entry.metadata() {
+                        *total += metadata.len();
                     }
                 }
+                Ok(file_type) if file_type.is_symlink() => visit(&entry.path(), total),
+                _ => {}
             }
-            _ => {}
         }
     }
 
@@ -5769,6 +5835,10 @@ impl AppShell for AppState {
     fn update(&mut self, ctx: &eframe::egui::Context) {
         crate::ui::draw_ui(ctx, self);
     }
+
+    fn on_exit(&mut self) {
+        self.flush_config();
+    }
 }
 
 #[cfg(test)]
@@ -5798,6 +5868,18 @@ mod tests {
         );
     }
 
+    #[test]
+    fn persisting_config_defers_the_disk_write() {
+        let mut state = AppState::default();
+        assert_eq!(state.pending_config_save_delay(), None);
+
+        state.persist_config();
+        let delay = state
+            .pending_config_save_delay()
+            .expect("el cambio debe quedar pendiente de guardar");
+        assert!(delay <= CONFIG_SAVE_DEBOUNCE);
+    }
+
     #[test]
     fn activating_navigation_updates_state() {
         let mut state = AppState::default();
@@ -2696,13 +2696,6 @@ fn parse_markdown_blocks(text: &str) -> Vec<MarkdownBlock> {
 
     for line in text.lines() {
         let trimmed_start = line.trim_start();
-        let trimmed = line.trim();
-
-        let is_table_candidate =
-            trimmed.contains('|') && trimmed.chars().filter(|ch| *ch == '|').count() >= 2;
-        let is_table_separator = trimmed
-            .chars()
-            .all(|ch| matches!(ch, '|' | '-' | ':' | ' '));
 
         if in_code_block {
             if trimmed_start.starts_with("```") {
@@ -2735,6 +2728,16 @@ fn parse_markdown_blocks(text: &str) -> Vec<MarkdownBlock> {
             continue;
         }
 
+        // Las comprobaciones de tabla solo se evalúan fuera de bloques de código y cuando la línea
+        // puede formar parte de una tabla.
+        let trimmed = trimmed_start.trim_end();
+        let is_table_candidate =
+            trimmed.contains('|') && trimmed.chars().filter(|ch| *ch == '|').count() >= 2;
+        let is_table_separator = (in_table || is_table_candidate)
+            && trimmed
+                .chars()
+                .all(|ch| matches!(ch, '|' | '-' | ':' | ' '));
+
         if in_table && (!is_table_candidate || trimmed.is_empty()) {
             flush_table_block(
                 &mut blocks,
@@ -2761,15 +2764,6 @@ fn parse_markdown_blocks(text: &str) -> Vec<MarkdownBlock> {
             continue;
         }
 
-        if trimmed_start.starts_with("```") {
-            flush_paragraph(&mut blocks, &mut paragraph);
-            flush_list(&mut blocks, &mut list_items);
-            code_language = trimmed_start[3..].trim().to_string();
-            in_code_block = true;
-            code_lines.clear();
-            continue;
-        }
-
         if trimmed.is_empty() {
             flush_paragraph(&mut blocks, &mut paragraph);
             flush_list(&mut blocks, &mut list_items);
@@ -6712,3 +6706,55 @@ fn usage_chip(ui: &mut egui::Ui, icon: &str, label: &str, value: usize, tokens:
             });
         });
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn markdown_table_skips_separator_row() {
+        let blocks = parse_markdown_blocks("| a | b |\n|---|:-:|\n| 1 | 2 |");
+        assert_eq!(blocks.len(), 1);
+        match &blocks[0] {
+            MarkdownBlock::Table { headers, rows } => {
+                assert_eq!(headers, &vec!["a".to_string(), "b".to_string()]);
+                assert_eq!(rows, &vec![vec!["1".to_string(), "2".to_string()]]);
+            }
+            other => panic!("se esperaba una tabla, se obtuvo {other:?}"),
+        }
+    }
+
+    #[test]
+    fn markdown_code_fence_keeps_pipe_lines_verbatim() {
+        let blocks = parse_markdown_blocks("```text\n|a|b|\n|---|\n```");
+        assert_eq!(blocks.len(), 1);
+        match &blocks[0] {
+            MarkdownBlock::CodeBlock { language, code } => {
+                assert_eq!(language, "text");
+                assert_eq!(code, "|a|b|\n|---|");
+            }
+            other => panic!("se esperaba un bloque de código, se obtuvo {other:?}"),
+        }
+    }
+
+    #[test]
+    fn markdown_table_is_flushed_before_code_fence() {
+        let blocks =
+            parse_markdown_blocks("| a | b |\n|---|---|\n| 1 | 2 |\n```rust\nlet x = 1;\n```");
+        assert_eq!(blocks.len(), 2);
+        match &blocks[0] {
+            MarkdownBlock::Table { headers, rows } => {
+                assert_eq!(headers, &vec!["a".to_string(), "b".to_string()]);
+                assert_eq!(rows.len(), 1);
+            }
+            other => panic!("se esperaba una tabla, se obtuvo {other:?}"),
+        }
+        match &blocks[1] {
+            MarkdownBlock::CodeBlock { language, code } => {
+                assert_eq!(language, "rust");
+                assert_eq!(code, "let x = 1;");
+            }
+            other => panic!("se esperaba un bloque de código, se obtuvo {other:?}"),
+        }
+    }
+}
@@ -16,6 +16,9 @@ pub fn draw_ui(ctx: &egui::Context, state: &mut AppState) {
     if state.update_async_tasks() {
         ctx.request_repaint();
     }
+    if let Some(delay) = state.pending_config_save_delay() {
+        ctx.request_repaint_after(delay);
+    }
     theme::apply(ctx, &state.theme);
     state.sync_active_tab_from_view();
     ctx.style_mut(|style| {
@@ -12,6 +12,9 @@ pub trait AppShell: 'static {
 
     /// Renderiza la shell en cada frame con acceso al contexto global de egui.
     fn update(&mut self, ctx: &egui::Context);
+
+    /// Se invoca una vez al cerrar la aplicación, antes de destruir el estado.
+    fn on_exit(&mut self) {}
 }
 
 struct MultimodalApp {
@@ -29,6 +32,10 @@ impl App for MultimodalApp {
     fn update(&mut self, ctx: &egui::Context, _frame: &mut Frame) {
         self.shell.update(ctx);
     }
+
+    fn on_exit(&mut self, _gl: Option<&eframe::glow::Context>) {
+        self.shell.on_exit();
+    }
 }
 
 /// Ejecuta una aplicación shell reutilizable basada en egui.